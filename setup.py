@@ -20,6 +20,14 @@ def get_version():
                 return line.split("=")[1].strip().strip('"\'')
     return "1.0.0"
 
+# Optionally compile the hot paths with mypyc (requires mypy at build time);
+# without it the package is pure Python
+def get_ext_modules():
+    if os.environ.get("UNEFF_USE_MYPYC") != "1":
+        return []
+    from mypyc.build import mypycify
+    return mypycify(["uneff/_core.py"])
+
 setup(
     name="uneff",
     version=get_version(),
@@ -34,6 +42,7 @@ setup(
         "uneff": ["uneff_mappings.csv"],
     },
     include_package_data=True,
+    ext_modules=get_ext_modules(),
     entry_points={
         "console_scripts": [
             "uneff=uneff.core:main",
@@ -8,11 +8,54 @@ or with custom storage systems.
 
 import sys
 import os
+import bisect
 import csv
+import codecs
 import io
-from typing import List, Tuple, Dict, Optional, Union
+import mmap
+import re
+import shutil
+import string
+import tempfile
+from functools import lru_cache
+from typing import Any, List, Tuple, Dict, Optional, Union, NamedTuple, Pattern, Callable
 
 
+class _CompiledMappings(NamedTuple):
+    """Lookup structures derived once from a list of character mappings."""
+    mappings: Tuple[Tuple[str, str, str], ...]
+    ascii_mappings: Tuple[Tuple[str, str, str], ...]
+    ascii_closed: bool
+    pattern: Optional[Pattern]
+    char_pattern: Optional[Pattern]
+    has_sequences: bool
+    lead_bytes: Tuple[bytes, ...]
+    replace_all: Optional[Callable[[str], str]]
+    ascii_table: Optional[bytes]
+    ascii_delete: bytes
+
+
+# Byte order marks, UTF-32 first so its LE mark is not taken for UTF-16 LE
+_BOMS = (
+    (b'\x00\x00\xfe\xff', "UTF-32 BE BOM"),
+    (b'\xff\xfe\x00\x00', "UTF-32 LE BOM"),
+    (b'\xef\xbb\xbf', "UTF-8 BOM"),
+    (b'\xfe\xff', "UTF-16 BE BOM"),
+    (b'\xff\xfe', "UTF-16 LE BOM"),
+)
+
+# Files larger than this are cleaned in chunks rather than loaded whole
+_STREAM_THRESHOLD = 8 * 1024 * 1024
+_STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Mapping sets up to this size are cleaned by a generated replace() chain
+_MAX_CHAINED_MAPPINGS = 8
+
+# Parsed mappings per (absolute path, modification time) of a mappings file
+_MAPPINGS_CACHE: Dict[Tuple[str, int], Tuple[Tuple[Tuple[str, str, str], ...], _CompiledMappings]] = {}
+
+
+@lru_cache(maxsize=1)
 def get_default_mappings_csv() -> str:
     """
     Generate default character mappings as a CSV string.
@@ -170,15 +213,17 @@ def get_default_mappings_csv() -> str:
     return output.getvalue()
 
 
-def create_default_mappings(mapping_file: str) -> None:
+def create_default_mappings(mapping_file: str, verbose: bool = True) -> None:
     """
     Create a default mapping file with common problematic characters.
     
     Args:
         mapping_file (str): Path to save the mappings file
+        verbose (bool): Whether to print status messages
     """
-    print(f"Mappings file not found at: {mapping_file}")
-    print("Creating default mappings file...")
+    if verbose:
+        print(f"Mappings file not found at: {mapping_file}")
+        print("Creating default mappings file...")
     
     mappings_csv = get_default_mappings_csv()
     
@@ -186,7 +231,8 @@ def create_default_mappings(mapping_file: str) -> None:
     with open(mapping_file, 'w', newline='', encoding='utf-8') as f:
         f.write(mappings_csv)
     
-    print(f"Default mappings saved to: {mapping_file}")
+    if verbose:
+        print(f"Default mappings saved to: {mapping_file}")
 
 
 def parse_mapping_csv(csv_content: str) -> List[Tuple[str, str, str]]:
@@ -200,6 +246,7 @@ def parse_mapping_csv(csv_content: str) -> List[Tuple[str, str, str]]:
         list: List of tuples with (char, name, replacement) for chars to process
     """
     mappings = []
+    seen = set()
     
     # Use CSV reader on string content
     reader = csv.reader(io.StringIO(csv_content))
@@ -226,15 +273,39 @@ def parse_mapping_csv(csv_content: str) -> List[Tuple[str, str, str]]:
         if remove:
             # Convert unicode escape sequence to the actual character
             try:
-                # Handle the unicode escape sequence
-                char = bytes(unicode_str, 'utf-8').decode('unicode_escape')
-                mappings.append((char, name, replacement))
+                if (len(unicode_str) == 6 and unicode_str.startswith('\\u')
+                        and all(c in string.hexdigits for c in unicode_str[2:])):
+                    # Common \uXXXX form, parsed without the codec machinery;
+                    # int() would also accept signs, spaces and underscores
+                    char = chr(int(unicode_str[2:], 16))
+                else:
+                    # Handle any other unicode escape sequence
+                    char = codecs.decode(unicode_str, 'unicode_escape')
             except Exception:
                 continue
+            
+            # First mapping wins if a character is listed more than once
+            if char and char not in seen:
+                seen.add(char)
+                mappings.append((char, name, replacement))
     
     return mappings
 
 
+@lru_cache(maxsize=32)
+def _parse_mapping_csv_cached(csv_content: str) -> Tuple[Tuple[str, str, str], ...]:
+    """
+    Parse character mappings, reusing the result for identical CSV content.
+    
+    Args:
+        csv_content (str): Content of the mappings CSV
+        
+    Returns:
+        tuple: Tuples with (char, name, replacement) for chars to process
+    """
+    return tuple(parse_mapping_csv(csv_content))
+
+
 def read_char_mappings(mapping_file: str, verbose: bool = True) -> List[Tuple[str, str, str]]:
     """
     Read character mappings from CSV file.
@@ -247,27 +318,48 @@ def read_char_mappings(mapping_file: str, verbose: bool = True) -> List[Tuple[st
     Returns:
         list: List of tuples with (char, name, replacement) for chars to process
     """
+    mappings, _ = _load_mappings(mapping_file, verbose)
+    return list(mappings)
+
+
+def _load_mappings(mapping_file: str, verbose: bool = True) -> Tuple[Tuple[Tuple[str, str, str], ...], _CompiledMappings]:
+    """
+    Read and compile character mappings, reusing earlier results for an unchanged file.
+    
+    Args:
+        mapping_file (str): Path to the mappings file
+        verbose (bool): Whether to print status messages
+        
+    Returns:
+        tuple: (mappings, compiled_mappings)
+    """
     try:
         # Create default file if it doesn't exist
         if not os.path.exists(mapping_file):
-            if verbose:
-                create_default_mappings(mapping_file)
-            else:
-                # Create silently if not verbose
-                with open(mapping_file, 'w', newline='', encoding='utf-8') as f:
-                    f.write(get_default_mappings_csv())
+            create_default_mappings(mapping_file, verbose)
         
-        # Read file content
-        with open(mapping_file, 'r', encoding='utf-8') as f:
-            csv_content = f.read()
+        abs_path = os.path.abspath(mapping_file)
+        key = (abs_path, os.stat(mapping_file).st_mtime_ns)
+        cached = _MAPPINGS_CACHE.get(key)
         
-        # Parse the CSV content
-        mappings = parse_mapping_csv(csv_content)
+        if cached is None:
+            # Read file content
+            with open(mapping_file, 'r', encoding='utf-8') as f:
+                csv_content = f.read()
+            
+            # Parse the CSV content
+            mappings = _parse_mapping_csv_cached(csv_content)
+            cached = (mappings, _compile_mappings(mappings))
+            
+            # Drop entries for earlier versions of the same file
+            for old_key in [k for k in _MAPPINGS_CACHE if k[0] == abs_path]:
+                del _MAPPINGS_CACHE[old_key]
+            _MAPPINGS_CACHE[key] = cached
         
         if verbose:
-            print(f"Loaded {len(mappings)} problematic character mappings from: {mapping_file}")
+            print(f"Loaded {len(cached[0])} problematic character mappings from: {mapping_file}")
         
-        return mappings
+        return cached
         
     except Exception as e:
         if verbose:
@@ -275,8 +367,250 @@ def read_char_mappings(mapping_file: str, verbose: bool = True) -> List[Tuple[st
             print("Using default mappings instead.")
         
         # Use the default mappings in memory
-        mappings_csv = get_default_mappings_csv()
-        return parse_mapping_csv(mappings_csv)
+        mappings = _parse_mapping_csv_cached(get_default_mappings_csv())
+        return mappings, _compile_mappings(mappings)
+
+
+@lru_cache(maxsize=32)
+def _compile_mappings(problematic_chars: Tuple[Tuple[str, str, str], ...]) -> _CompiledMappings:
+    """
+    Build the lookup structures used to clean text with a set of mappings.
+    
+    Results are cached so repeated calls with the same mappings reuse them.
+    
+    Args:
+        problematic_chars (tuple): Tuples of (char, name, replacement)
+        
+    Returns:
+        _CompiledMappings: The mappings and the structures derived from them
+    """
+    # parse_mapping_csv has already dropped duplicate characters
+    mappings = problematic_chars
+    
+    ascii_mappings = [mapping for mapping in mappings if mapping[0].isascii()]
+    
+    # ASCII text only ever needs the ASCII mappings if none of them brings in
+    # a non-ASCII character that a later mapping would replace again
+    ascii_closed = all(replacement.isascii() for _, _, replacement in ascii_mappings)
+    
+    # A character class compiles to a two-level (page, bitmap) lookup in the
+    # regex engine, so single characters are tested in constant time
+    single_chars = [char for char, _, _ in mappings if len(char) == 1]
+    char_pattern = None
+    if single_chars:
+        char_pattern = re.compile('[' + ''.join(re.escape(char) for char in single_chars) + ']')
+    
+    sequences = sorted((char for char, _, _ in mappings if len(char) > 1), key=len, reverse=True)
+    pattern: Optional[Pattern]
+    if sequences:
+        # Longest first so multi-character sequences win over their prefixes
+        all_chars = sequences + single_chars
+        pattern = re.compile('|'.join(re.escape(seq) for seq in all_chars))
+    else:
+        pattern = char_pattern
+    
+    has_sequences = bool(sequences)
+    
+    # First UTF-8 byte of every mapped character, for a raw-bytes prescan
+    lead_bytes = sorted({char.encode('utf-8', 'surrogatepass')[:1] for char, _, _ in mappings})
+    
+    # For a handful of mappings, generated straight-line code beats looping
+    # over the mappings for every string; each replace() is guarded because
+    # a membership test costs far less than a replace() that finds nothing
+    replace_all: Optional[Callable[[str], str]] = None
+    if len(mappings) <= _MAX_CHAINED_MAPPINGS:
+        source = "def replace_all(s):\n" + "".join(
+            f"    if {char!r} in s:\n        s = s.replace({char!r}, {replacement!r})\n"
+            for char, _, replacement in mappings) + "    return s\n"
+        namespace: Dict[str, Any] = {}
+        exec(source, namespace)
+        replace_all = namespace['replace_all']
+    
+    # ASCII content can be cleaned with bytes.translate when every ASCII mapping
+    # is a single character replaced by nothing or by one unmapped ASCII character
+    mapped_chars = {char for char, _, _ in mappings}
+    ascii_table = None
+    ascii_delete = b''
+    if all(len(char) == 1 and len(replacement) <= 1 and replacement.isascii()
+           and replacement not in mapped_chars
+           for char, _, replacement in ascii_mappings):
+        translated = [(char, replacement) for char, _, replacement in ascii_mappings if replacement]
+        ascii_table = bytes.maketrans(''.join(char for char, _ in translated).encode('ascii'),
+                                      ''.join(repl for _, repl in translated).encode('ascii'))
+        ascii_delete = ''.join(char for char, _, replacement in ascii_mappings
+                               if not replacement).encode('ascii')
+    
+    return _CompiledMappings(mappings, tuple(ascii_mappings), ascii_closed, pattern,
+                             char_pattern, has_sequences, tuple(lead_bytes), replace_all,
+                             ascii_table, ascii_delete)
+
+
+def _apply_mappings(text_content: str, compiled: _CompiledMappings,
+                    count: bool = True) -> Tuple[str, Dict[str, int]]:
+    """
+    Count and replace mapped characters in text.
+    
+    Args:
+        text_content (str): Text to clean
+        compiled (_CompiledMappings): Compiled character mappings
+        count (bool): Whether to count occurrences; if False, char_counts is empty
+        
+    Returns:
+        tuple: (cleaned_content, char_counts)
+    """
+    if not count and compiled.replace_all is not None:
+        return compiled.replace_all(text_content), {}
+    
+    if compiled.ascii_closed and text_content.isascii():
+        # Nothing outside the ASCII range can occur, so skip those mappings
+        candidates = compiled.ascii_mappings
+    elif compiled.pattern is None or not compiled.pattern.search(text_content):
+        # One scan proves the text is clean instead of one scan per mapping
+        return text_content, {}
+    else:
+        candidates = compiled.mappings
+    
+    cleaned_content = text_content
+    char_counts: Dict[str, int] = {}
+    
+    if not count:
+        # A membership test is far cheaper than replace() on a miss, and most
+        # mapped characters are absent from any given text
+        for char, _, replacement in candidates:
+            if char in cleaned_content:
+                cleaned_content = cleaned_content.replace(char, replacement)
+        return cleaned_content, char_counts
+    
+    for char, name, replacement in candidates:
+        char_count = cleaned_content.count(char)
+        if char_count > 0:
+            char_counts[name] = char_count
+            cleaned_content = cleaned_content.replace(char, replacement)
+    
+    return cleaned_content, char_counts
+
+
+def _apply_ascii_mappings(binary_content: bytes, compiled: _CompiledMappings,
+                          count: bool = True) -> Tuple[bytes, Dict[str, int]]:
+    """
+    Clean pure ASCII content as bytes, without decoding or re-encoding it.
+    
+    Args:
+        binary_content (bytes): ASCII content to clean
+        compiled (_CompiledMappings): Compiled mappings with an ASCII table
+        count (bool): Whether to count occurrences; if False, char_counts is empty
+        
+    Returns:
+        tuple: (cleaned_bytes, char_counts)
+    """
+    char_counts: Dict[str, int] = {}
+    if count:
+        for char, name, _ in compiled.ascii_mappings:
+            char_count = binary_content.count(char.encode('ascii'))
+            if char_count > 0:
+                char_counts[name] = char_count
+    
+    return binary_content.translate(compiled.ascii_table, compiled.ascii_delete), char_counts
+
+
+def _read_bytes(file_path: str) -> bytes:
+    """
+    Read a whole file with one sized read on a raw file descriptor.
+    
+    Args:
+        file_path (str): Path to the file to read
+        
+    Returns:
+        bytes: File content
+    """
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        size = os.fstat(fd).st_size
+        chunks = [os.read(fd, size)] if size else []
+        
+        # Reads can come back short, and the file may have grown since fstat
+        while True:
+            chunk = os.read(fd, _STREAM_CHUNK_SIZE)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        
+        return chunks[0] if len(chunks) == 1 else b''.join(chunks)
+    finally:
+        os.close(fd)
+
+
+def _write_bytes(file_path: str, data: bytes) -> None:
+    """
+    Write a whole file through a raw file descriptor.
+    
+    Args:
+        file_path (str): Path to the file to write
+        data (bytes): Content to write
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(file_path, flags, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+def _is_unchanged_utf8(binary_content: bytes, compiled: _CompiledMappings) -> bool:
+    """
+    Check whether raw content would come out of cleaning byte-for-byte unchanged.
+    
+    Each lead byte is a single-byte search, so content that contains none of
+    them is ruled out without decoding and pattern-matching the whole text.
+    
+    Args:
+        binary_content (bytes): Raw file content
+        compiled (_CompiledMappings): Compiled character mappings
+        
+    Returns:
+        bool: True if no mapped character can be present and the content is valid UTF-8
+    """
+    for lead in compiled.lead_bytes:
+        if lead in binary_content:
+            return False
+    
+    if binary_content.isascii():
+        return True
+    
+    # Invalid sequences would be turned into replacement characters
+    try:
+        binary_content.decode('utf-8')
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def _decode_content(content: Union[bytes, str]) -> str:
+    """
+    Decode content to text, keeping any BOM so it can be handled by the mappings.
+    
+    Args:
+        content (bytes or str): Content to decode
+        
+    Returns:
+        str: Decoded text
+    """
+    if not isinstance(content, bytes):
+        return content
+    
+    # Try to decode to text without removing BOM first
+    try:
+        return content.decode('utf-8')
+    except UnicodeDecodeError:
+        # Try with error handling
+        try:
+            return content.decode('utf-8', errors='replace')
+        except:
+            # Last resort
+            return content.decode('latin-1')
 
 
 def clean_content(content: Union[bytes, str], mappings_csv: Optional[str] = None) -> Tuple[str, Dict[str, int]]:
@@ -290,40 +624,17 @@ def clean_content(content: Union[bytes, str], mappings_csv: Optional[str] = None
     Returns:
         tuple: (cleaned_content, char_counts)
     """
-    # Process content based on type
-    if isinstance(content, bytes):
-        # Try to decode to text without removing BOM first
-        try:
-            text_content = content.decode('utf-8')
-        except UnicodeDecodeError:
-            # Try with error handling
-            try:
-                text_content = content.decode('utf-8', errors='replace')
-            except:
-                # Last resort
-                text_content = content.decode('latin-1')
-    else:
-        text_content = content
+    text_content = _decode_content(content)
     
     # Load character mappings
     if mappings_csv is None:
         mappings_csv = get_default_mappings_csv()
     
-    problematic_chars = parse_mapping_csv(mappings_csv)
-    
-    # Use the full content for character mapping processing
-    cleaned_content = text_content
-    
-    # Count and replace problematic characters
-    char_counts = {}
+    problematic_chars = _parse_mapping_csv_cached(mappings_csv)
+    compiled = _compile_mappings(problematic_chars)
     
-    for char, name, replacement in problematic_chars:
-        count = cleaned_content.count(char)
-        if count > 0:
-            char_counts[name] = count
-            cleaned_content = cleaned_content.replace(char, replacement)
-    
-    return cleaned_content, char_counts
+    # Count and replace problematic characters in one pass
+    return _apply_mappings(text_content, compiled)
 
 
 def analyze_content(content: Union[bytes, str], mappings_csv: Optional[str] = None) -> Dict:
@@ -343,21 +654,12 @@ def analyze_content(content: Union[bytes, str], mappings_csv: Optional[str] = No
         has_bom = False
         bom_type = None
         
-        if content.startswith(b'\xef\xbb\xbf'):  # UTF-8 BOM
-            has_bom = True
-            bom_type = "UTF-8 BOM"
-        elif content.startswith(b'\xfe\xff'):
-            has_bom = True
-            bom_type = "UTF-16 BE BOM"
-        elif content.startswith(b'\xff\xfe'):
-            has_bom = True
-            bom_type = "UTF-16 LE BOM"
-        elif content.startswith(b'\x00\x00\xfe\xff'):
-            has_bom = True
-            bom_type = "UTF-32 BE BOM"
-        elif content.startswith(b'\xff\xfe\x00\x00'):
-            has_bom = True
-            bom_type = "UTF-32 LE BOM"
+        head = content[:4]
+        for prefix, label in _BOMS:
+            if head.startswith(prefix):
+                has_bom = True
+                bom_type = label
+                break
         
         # Try to decode to text
         try:
@@ -379,57 +681,65 @@ def analyze_content(content: Union[bytes, str], mappings_csv: Optional[str] = No
         text_content = content
         encoding = "string (already decoded)"
         encoding_errors = False
-        has_bom = text_content and '\ufeff' in text_content
+        has_bom = '\ufeff' in text_content
         bom_type = "UTF-8 BOM" if has_bom else None
     
     # Load character mappings
     if mappings_csv is None:
         mappings_csv = get_default_mappings_csv()
     
-    problematic_chars = parse_mapping_csv(mappings_csv)
+    problematic_chars = _parse_mapping_csv_cached(mappings_csv)
     
     # Analyze problematic characters
-    char_counts = {}
+    char_counts: Dict[str, int] = {}
     character_details = []
     
-    # Split content into lines for location analysis
-    lines = text_content.split('\n')
+    # Collect the offsets (and so the counts) of every mapped character in one regex scan
+    offsets: Dict[str, List[int]] = {}
+    char_pattern = _compile_mappings(problematic_chars).char_pattern
+    if char_pattern is not None:
+        for match in char_pattern.finditer(text_content):
+            offsets.setdefault(match.group(), []).append(match.start())
+    
+    # Newline offsets map an absolute position to its line and column
+    newlines = [match.start() for match in re.finditer('\n', text_content)] if offsets else []
     
     for char, name, replacement in problematic_chars:
+        if len(char) == 1:
+            # The scan above already found every occurrence
+            char_offsets = offsets.get(char, [])
+            count = len(char_offsets)
+        else:
+            char_offsets = []
+            count = text_content.count(char)
+        
         # Skip if character is not present
-        if char not in text_content:
+        if count == 0:
             continue
-            
-        count = text_content.count(char)
+        
         char_counts[name] = count
         
         # Find all occurrences with detailed location information
         all_locations = []
         
-        # Track absolute position in the file
-        absolute_pos = 0
-        
-        for line_idx, line in enumerate(lines):
-            # Process each character in the line
-            for col_idx, c in enumerate(line):
-                if c == char:
-                    # Calculate context (15 chars before and after)
-                    context_start = max(0, col_idx - 15)
-                    context_end = min(len(line), col_idx + 15)
-                    context = line[context_start:context_end].replace(char, "↯")
-                    
-                    location_info = {
-                        'line': line_idx + 1,  # 1-based line number
-                        'column': col_idx + 1,  # 1-based column number
-                        'absolute_position': absolute_pos,
-                        'context': context
-                    }
-                    all_locations.append(location_info)
-                
-                absolute_pos += 1
+        for absolute_pos in char_offsets:
+            line_idx = bisect.bisect_left(newlines, absolute_pos)
+            line_start = newlines[line_idx - 1] + 1 if line_idx else 0
+            line_end = newlines[line_idx] if line_idx < len(newlines) else len(text_content)
+            col_idx = absolute_pos - line_start
             
-            # Account for newline character in absolute position
-            absolute_pos += 1
+            # Calculate context (15 chars before and after, within the line)
+            context_start = max(line_start, absolute_pos - 15)
+            context_end = min(line_end, absolute_pos + 15)
+            context = text_content[context_start:context_end].replace(char, "↯")
+            
+            location_info = {
+                'line': line_idx + 1,  # 1-based line number
+                'column': col_idx + 1,  # 1-based column number
+                'absolute_position': absolute_pos,
+                'context': context
+            }
+            all_locations.append(location_info)
         
         # Limit sample locations to first 10 for display
         sample_locations = all_locations[:10]
@@ -451,7 +761,7 @@ def analyze_content(content: Union[bytes, str], mappings_csv: Optional[str] = No
         'encoding': encoding,
         'encoding_errors': encoding_errors,
         'total_length': len(text_content),
-        'line_count': len(lines),
+        'line_count': text_content.count('\n') + 1,
         'problematic_char_count': sum(char_counts.values()),
         'character_counts': char_counts,
         'character_details': character_details
@@ -460,6 +770,188 @@ def analyze_content(content: Union[bytes, str], mappings_csv: Optional[str] = No
     return results
 
 
+def _copy_unchanged_mapping(mapped: mmap.mmap, output_path: Optional[str],
+                            compiled: _CompiledMappings) -> bool:
+    """
+    Copy a memory-mapped file unchanged if cleaning would not alter it.
+    
+    Args:
+        mapped (mmap.mmap): Memory-mapped input file
+        output_path (str, optional): Path to save the copy. If None, only checks the file.
+        compiled (_CompiledMappings): Compiled character mappings
+        
+    Returns:
+        bool: True if the file was copied, False if it needs cleaning
+    """
+    # Single-byte searches run directly against the mapped pages
+    for lead in compiled.lead_bytes:
+        if mapped.find(lead) != -1:
+            return False
+    
+    # Invalid sequences would be turned into replacement characters
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    writer = open(output_path, 'wb') if output_path is not None else None
+    try:
+        for start in range(0, len(mapped), _STREAM_CHUNK_SIZE):
+            chunk = mapped[start:start + _STREAM_CHUNK_SIZE]
+            try:
+                decoder.decode(chunk)
+            except UnicodeDecodeError:
+                return False
+            if writer is not None:
+                writer.write(chunk)
+        try:
+            decoder.decode(b'', final=True)
+        except UnicodeDecodeError:
+            return False
+    finally:
+        if writer is not None:
+            writer.close()
+    
+    return True
+
+
+def _is_unchanged_file(file_path: str, compiled: _CompiledMappings) -> bool:
+    """
+    Check through a memory map whether cleaning would leave a file unchanged.
+    
+    Args:
+        file_path (str): Path to the file to check
+        compiled (_CompiledMappings): Compiled character mappings
+        
+    Returns:
+        bool: True if the file needs no cleaning, False if it does or cannot be mapped
+    """
+    with open(file_path, 'rb') as file:
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return False
+        try:
+            return _copy_unchanged_mapping(mapped, None, compiled)
+        finally:
+            mapped.close()
+
+
+def _is_same_file(file_path: str, output_path: str) -> bool:
+    """
+    Check whether two paths refer to the same existing file.
+    
+    Args:
+        file_path (str): Path to the input file
+        output_path (str): Path to the output file, which may not exist yet
+        
+    Returns:
+        bool: True if both paths name the same file
+    """
+    try:
+        return os.path.samefile(file_path, output_path)
+    except OSError:
+        return False
+
+
+def _clean_stream(file_path: str, output_path: str, compiled: _CompiledMappings,
+                  count: bool = True) -> Dict[str, int]:
+    """
+    Clean a large file chunk by chunk, including in place.
+    
+    Opening the input for writing would truncate it while it is still being
+    read, and a truncated memory map kills the process with SIGBUS, so this
+    check happens before the input is mapped. In-place output goes to a
+    temporary file in the same directory that then replaces the original,
+    and a file that is already clean is left untouched.
+    
+    Args:
+        file_path (str): Path to the file to clean
+        output_path (str): Path to save the cleaned file
+        compiled (_CompiledMappings): Compiled character mappings
+        count (bool): Whether to count occurrences
+        
+    Returns:
+        dict: Counts of processed characters by name
+    """
+    if not _is_same_file(file_path, output_path):
+        return _write_clean_stream(file_path, output_path, compiled, count)
+    
+    if _is_unchanged_file(file_path, compiled):
+        return {}
+    
+    # Replace the link target rather than the link itself
+    output_path = os.path.realpath(output_path)
+    fd, temp_path = tempfile.mkstemp(prefix='.uneff_', dir=os.path.dirname(output_path))
+    os.close(fd)
+    try:
+        char_counts = _write_clean_stream(file_path, temp_path, compiled, count)
+        shutil.copymode(output_path, temp_path)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    
+    return char_counts
+
+
+def _write_clean_stream(file_path: str, output_path: str, compiled: _CompiledMappings,
+                        count: bool = True) -> Dict[str, int]:
+    """
+    Clean a file chunk by chunk so it is never held in memory whole.
+    
+    The input is memory-mapped where possible, so it is paged in on demand
+    rather than copied through a read buffer. output_path must not be the
+    input file; _clean_stream handles that case.
+    
+    Args:
+        file_path (str): Path to the file to clean
+        output_path (str): Path to save the cleaned file
+        compiled (_CompiledMappings): Compiled character mappings
+        count (bool): Whether to count occurrences
+        
+    Returns:
+        dict: Counts of processed characters by name
+    """
+    totals: Dict[str, int] = {}
+    
+    with open(file_path, 'rb') as file:
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            mapped = None
+        
+        try:
+            if mapped is not None:
+                if hasattr(mapped, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                if _copy_unchanged_mapping(mapped, output_path, compiled):
+                    return {}
+            
+            # mmap objects read like files, so both sources share one loop
+            source = mapped if mapped is not None else file
+            source.seek(0)
+            
+            # The incremental decoder keeps multi-byte characters intact across chunks
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            with open(output_path, 'wb', buffering=_STREAM_CHUNK_SIZE) as writer:
+                while True:
+                    chunk = source.read(_STREAM_CHUNK_SIZE)
+                    text_chunk = decoder.decode(chunk, final=not chunk)
+                    if text_chunk:
+                        cleaned_chunk, chunk_counts = _apply_mappings(text_chunk, compiled, count)
+                        writer.write(cleaned_chunk.encode('utf-8'))
+                        for name, char_count in chunk_counts.items():
+                            totals[name] = totals.get(name, 0) + char_count
+                    if not chunk:
+                        break
+        finally:
+            if mapped is not None:
+                mapped.close()
+    
+    # Report in mapping order, matching the in-memory path
+    return {name: totals[name] for _, name, _ in compiled.mappings if name in totals}
+
+
 def clean_file(file_path: str, mapping_file: Optional[str] = None, 
               output_path: Optional[str] = None, verbose: bool = True,
               return_content: bool = False) -> Union[bool, str]:
@@ -486,11 +978,7 @@ def clean_file(file_path: str, mapping_file: Optional[str] = None,
             mapping_file = os.path.join(script_dir, 'uneff_mappings.csv')
         
         # Read problematic character mappings - this will create the file if it doesn't exist
-        mappings = read_char_mappings(mapping_file, verbose)
-        
-        # Read the file content as binary
-        with open(file_path, 'rb') as file:
-            binary_content = file.read()
+        _, compiled = _load_mappings(mapping_file, verbose)
         
         # Create output filename if not provided
         if output_path is None:
@@ -498,19 +986,43 @@ def clean_file(file_path: str, mapping_file: Optional[str] = None,
             file_name = os.path.basename(file_path)
             output_path = os.path.join(file_dir, f"uneffd_{file_name}")
         
-        # Generate mappings CSV from the mappings
-        mappings_csv = io.StringIO()
-        writer = csv.writer(mappings_csv, quoting=csv.QUOTE_MINIMAL, lineterminator='\n')
-        writer.writerow(["Character", "Unicode", "Name", "Remove", "Replacement"])
-        for char, name, replacement in mappings:
-            writer.writerow(["", f"\\u{ord(char):04x}", name, "True", replacement])
-        
-        # Clean the content
-        cleaned_content, char_counts = clean_content(binary_content, mappings_csv.getvalue())
-        
-        # Write to new file without problematic characters
-        with open(output_path, 'w', encoding='utf-8') as file:
-            file.write(cleaned_content)
+        # Stream large files unless the caller wants the content back;
+        # multi-character sequences could straddle chunk boundaries
+        if (not return_content and not compiled.has_sequences
+                and os.path.getsize(file_path) > _STREAM_THRESHOLD):
+            char_counts = _clean_stream(file_path, output_path, compiled, verbose)
+        else:
+            # Read the file content as binary
+            binary_content = _read_bytes(file_path)
+            
+            if not return_content and _is_unchanged_utf8(binary_content, compiled):
+                # Nothing to clean, so copy the bytes without decoding them
+                _write_bytes(output_path, binary_content)
+                char_counts = {}
+            elif compiled.ascii_table is not None and binary_content.isascii():
+                # Only ASCII mappings can match, and bytes.translate applies them all in one pass
+                cleaned_bytes, char_counts = _apply_ascii_mappings(binary_content, compiled, verbose)
+                _write_bytes(output_path, cleaned_bytes)
+                if return_content:
+                    cleaned_content = cleaned_bytes.decode('ascii')
+            else:
+                try:
+                    text_content = binary_content.decode('utf-8')
+                    is_utf8 = True
+                except UnicodeDecodeError:
+                    text_content = _decode_content(binary_content)
+                    is_utf8 = False
+                
+                # Clean the content, counting only when the counts get reported
+                cleaned_content, char_counts = _apply_mappings(text_content, compiled, verbose)
+                
+                if is_utf8 and cleaned_content is text_content:
+                    # Nothing changed, so the original bytes are already the
+                    # UTF-8 encoding of the result and need no re-encoding
+                    _write_bytes(output_path, binary_content)
+                else:
+                    # Write to new file without problematic characters
+                    _write_bytes(output_path, cleaned_content.encode('utf-8'))
         
         # Log results
         if verbose:
@@ -564,8 +1076,7 @@ def analyze_file(file_path: str, mapping_file: Optional[str] = None,
             mappings_csv = f.read()
         
         # Read the file content as binary
-        with open(file_path, 'rb') as file:
-            binary_content = file.read()
+        binary_content = _read_bytes(file_path)
         
         # Analyze the content
         results = analyze_content(binary_content, mappings_csv)
@@ -628,15 +1139,11 @@ def clean_text(text: str, mapping_file: Optional[str] = None,
             script_dir = os.path.dirname(os.path.abspath(__file__))
             mapping_file = os.path.join(script_dir, 'uneff_mappings.csv')
         
-        # Ensure mapping file exists (this will create it if it doesn't)
-        read_char_mappings(mapping_file, verbose)
-        
-        # Now it's safe to read the file
-        with open(mapping_file, 'r', encoding='utf-8') as f:
-            mappings_csv = f.read()
+        # Load mappings (this will create the file if it doesn't exist)
+        _, compiled = _load_mappings(mapping_file, verbose)
         
         # Clean the content
-        cleaned_text, char_counts = clean_content(text, mappings_csv)
+        cleaned_text, char_counts = _apply_mappings(text, compiled, verbose)
         
         # Log results
         if verbose and char_counts:
@@ -653,6 +1160,77 @@ def clean_text(text: str, mapping_file: Optional[str] = None,
         return text
 
 
+def _find_files(directory: str) -> List[str]:
+    """
+    List the files under a directory, skipping earlier uneff output.
+    
+    Args:
+        directory (str): Directory to search recursively
+        
+    Returns:
+        list: Sorted file paths
+    """
+    file_paths = []
+    for root, _, file_names in os.walk(directory):
+        for file_name in file_names:
+            if not file_name.startswith('uneffd_'):
+                file_paths.append(os.path.join(root, file_name))
+    return sorted(file_paths)
+
+
+def _clean_file_worker(file_path: str, mapping_file: Optional[str]) -> bool:
+    """
+    Clean one file quietly; top-level so worker processes can run it.
+    
+    Args:
+        file_path (str): Path to the file to clean
+        mapping_file (str, optional): Path to character mappings file
+        
+    Returns:
+        bool: True if successful, False if error
+    """
+    return bool(clean_file(file_path=file_path, mapping_file=mapping_file, verbose=False))
+
+
+def _clean_files(file_paths: List[str], mapping_file: Optional[str],
+                 jobs: Optional[int], verbose: bool) -> int:
+    """
+    Clean many files in parallel worker processes.
+    
+    Args:
+        file_paths (list): Paths of the files to clean
+        mapping_file (str, optional): Path to character mappings file
+        jobs (int, optional): Number of worker processes. If None, uses the CPU count.
+        verbose (bool): Whether to print status messages
+        
+    Returns:
+        int: Number of files that could not be cleaned
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    
+    if mapping_file is None:
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        mapping_file = os.path.join(script_dir, 'uneff_mappings.csv')
+    
+    # Load once up front so a missing mappings file is created before the
+    # workers start, rather than by several of them at once
+    _load_mappings(mapping_file, verbose)
+    
+    if jobs == 1:
+        results = [_clean_file_worker(path, mapping_file) for path in file_paths]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(_clean_file_worker, file_paths,
+                                        [mapping_file] * len(file_paths), chunksize=8))
+    
+    failures = [path for path, ok in zip(file_paths, results) if not ok]
+    if verbose:
+        for path in failures:
+            print(f"Error processing file: {path}")
+        print(f"Cleaned {len(file_paths) - len(failures)} of {len(file_paths)} files")
+    return len(failures)
+
+
 def main():
     """
     Main function to handle command line arguments and call clean_file function.
@@ -660,14 +1238,44 @@ def main():
     import argparse
     
     parser = argparse.ArgumentParser(description='Remove BOM and process problematic Unicode characters from files.')
-    parser.add_argument('file', help='Path to the file to clean')
+    parser.add_argument('file', nargs='?', help='Path to the file to clean')
     parser.add_argument('-m', '--mapping', help='Path to custom character mappings file')
     parser.add_argument('-o', '--output', help='Path to save the cleaned file (default: adds uneffd_ prefix)')
     parser.add_argument('-q', '--quiet', action='store_true', help='Suppress status messages')
     parser.add_argument('-a', '--analyze', action='store_true', help='Only analyze file without cleaning')
+    parser.add_argument('-r', '--recursive', metavar='DIR', help='Process every file under a directory')
+    parser.add_argument('-j', '--jobs', type=int, help='Number of worker processes when cleaning with --recursive (default: CPU count)')
     
     args = parser.parse_args()
     
+    if args.jobs is not None and (not args.recursive or args.analyze):
+        parser.error('--jobs only applies when cleaning with --recursive')
+    
+    if args.recursive:
+        if args.file or args.output:
+            parser.error('--recursive cannot be combined with a file or --output')
+        if args.jobs is not None and args.jobs < 1:
+            parser.error('--jobs must be at least 1')
+        if not os.path.isdir(args.recursive):
+            print(f"Error: Directory '{args.recursive}' not found.")
+            return 1
+        
+        file_paths = _find_files(args.recursive)
+        if args.analyze:
+            for file_path in file_paths:
+                analyze_file(
+                    file_path=file_path,
+                    mapping_file=args.mapping,
+                    verbose=not args.quiet
+                )
+            return 0
+        
+        failures = _clean_files(file_paths, args.mapping, args.jobs, not args.quiet)
+        return 1 if failures else 0
+    
+    if not args.file:
+        parser.error('a file or --recursive DIR is required')
+    
     file_path = args.file
     if not os.path.exists(file_path):
         print(f"Error: File '{file_path}' not found.")
@@ -0,0 +1,325 @@
+"""
+Hot paths of Uneff: parsing mappings and cleaning text or bytes with them.
+
+Kept free of file and command-line handling so it can be compiled with mypyc;
+when no compiled build is installed this module runs as plain Python.
+"""
+
+import codecs
+import csv
+import io
+import re
+import string
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Pattern, Tuple, Union
+
+
+class _CompiledMappings(NamedTuple):
+    """Lookup structures derived once from a list of character mappings."""
+    mappings: Tuple[Tuple[str, str, str], ...]
+    ascii_mappings: Tuple[Tuple[str, str, str], ...]
+    ascii_closed: bool
+    pattern: Optional[Pattern]
+    char_pattern: Optional[Pattern]
+    has_sequences: bool
+    lead_bytes: Tuple[bytes, ...]
+    replace_all: Optional[Callable[[str], str]]
+    ascii_table: Optional[bytes]
+    ascii_delete: bytes
+
+
+# Byte order marks, UTF-32 first so its LE mark is not taken for UTF-16 LE
+_BOMS = (
+    (b'\x00\x00\xfe\xff', "UTF-32 BE BOM"),
+    (b'\xff\xfe\x00\x00', "UTF-32 LE BOM"),
+    (b'\xef\xbb\xbf', "UTF-8 BOM"),
+    (b'\xfe\xff', "UTF-16 BE BOM"),
+    (b'\xff\xfe', "UTF-16 LE BOM"),
+)
+
+# Mapping sets up to this size are cleaned by a generated replace() chain
+_MAX_CHAINED_MAPPINGS = 8
+
+
+def parse_mapping_csv(csv_content: str) -> List[Tuple[str, str, str]]:
+    """
+    Parse character mappings from CSV content string.
+    
+    Args:
+        csv_content (str): Content of the mappings CSV
+        
+    Returns:
+        list: List of tuples with (char, name, replacement) for chars to process
+    """
+    mappings = []
+    seen = set()
+    
+    # Use CSV reader on string content
+    reader = csv.reader(io.StringIO(csv_content))
+    header = next(reader, None)  # Get header row
+    
+    # Check if we have the Replacement column
+    has_replacement_col = header and len(header) >= 5 and header[4].strip().lower() == "replacement"
+    
+    for row in reader:
+        if len(row) < 4:
+            continue
+            
+        # Get values from fields
+        unicode_str = row[1].strip()
+        name = row[2].strip()
+        remove = row[3].strip().lower() == 'true'
+        
+        # Get replacement character if available
+        replacement = ""
+        if has_replacement_col and len(row) >= 5:
+            replacement = row[4]
+        
+        # Only add to mappings if set to remove
+        if remove:
+            # Convert unicode escape sequence to the actual character
+            try:
+                if (len(unicode_str) == 6 and unicode_str.startswith('\\u')
+                        and all(c in string.hexdigits for c in unicode_str[2:])):
+                    # Common \uXXXX form, parsed without the codec machinery;
+                    # int() would also accept signs, spaces and underscores
+                    char = chr(int(unicode_str[2:], 16))
+                else:
+                    # Handle any other unicode escape sequence
+                    char = codecs.decode(unicode_str, 'unicode_escape')
+            except Exception:
+                continue
+            
+            # First mapping wins if a character is listed more than once
+            if char and char not in seen:
+                seen.add(char)
+                mappings.append((char, name, replacement))
+    
+    return mappings
+
+
+@lru_cache(maxsize=32)
+def _parse_mapping_csv_cached(csv_content: str) -> Tuple[Tuple[str, str, str], ...]:
+    """
+    Parse character mappings, reusing the result for identical CSV content.
+    
+    Args:
+        csv_content (str): Content of the mappings CSV
+        
+    Returns:
+        tuple: Tuples with (char, name, replacement) for chars to process
+    """
+    return tuple(parse_mapping_csv(csv_content))
+
+
+@lru_cache(maxsize=32)
+def _compile_mappings(problematic_chars: Tuple[Tuple[str, str, str], ...]) -> _CompiledMappings:
+    """
+    Build the lookup structures used to clean text with a set of mappings.
+    
+    Results are cached so repeated calls with the same mappings reuse them.
+    
+    Args:
+        problematic_chars (tuple): Tuples of (char, name, replacement)
+        
+    Returns:
+        _CompiledMappings: The mappings and the structures derived from them
+    """
+    # parse_mapping_csv has already dropped duplicate characters
+    mappings = problematic_chars
+    
+    ascii_mappings = [mapping for mapping in mappings if mapping[0].isascii()]
+    
+    # ASCII text only ever needs the ASCII mappings if none of them brings in
+    # a non-ASCII character that a later mapping would replace again
+    ascii_closed = all(replacement.isascii() for _, _, replacement in ascii_mappings)
+    
+    # A character class compiles to a two-level (page, bitmap) lookup in the
+    # regex engine, so single characters are tested in constant time
+    single_chars = [char for char, _, _ in mappings if len(char) == 1]
+    char_pattern = None
+    if single_chars:
+        char_pattern = re.compile('[' + ''.join(re.escape(char) for char in single_chars) + ']')
+    
+    sequences = sorted((char for char, _, _ in mappings if len(char) > 1), key=len, reverse=True)
+    pattern: Optional[Pattern]
+    if sequences:
+        # Longest first so multi-character sequences win over their prefixes
+        all_chars = sequences + single_chars
+        pattern = re.compile('|'.join(re.escape(seq) for seq in all_chars))
+    else:
+        pattern = char_pattern
+    
+    has_sequences = bool(sequences)
+    
+    # First UTF-8 byte of every mapped character, for a raw-bytes prescan
+    lead_bytes = sorted({char.encode('utf-8', 'surrogatepass')[:1] for char, _, _ in mappings})
+    
+    # For a handful of mappings, generated straight-line code beats looping
+    # over the mappings for every string; each replace() is guarded because
+    # a membership test costs far less than a replace() that finds nothing
+    replace_all: Optional[Callable[[str], str]] = None
+    if len(mappings) <= _MAX_CHAINED_MAPPINGS:
+        source = "def replace_all(s):\n" + "".join(
+            f"    if {char!r} in s:\n        s = s.replace({char!r}, {replacement!r})\n"
+            for char, _, replacement in mappings) + "    return s\n"
+        namespace: Dict[str, Any] = {}
+        exec(source, namespace)
+        replace_all = namespace['replace_all']
+    
+    # ASCII content can be cleaned with bytes.translate when every ASCII mapping
+    # is a single character replaced by nothing or by one unmapped ASCII character
+    mapped_chars = {char for char, _, _ in mappings}
+    ascii_table = None
+    ascii_delete = b''
+    if all(len(char) == 1 and len(replacement) <= 1 and replacement.isascii()
+           and replacement not in mapped_chars
+           for char, _, replacement in ascii_mappings):
+        translated = [(char, replacement) for char, _, replacement in ascii_mappings if replacement]
+        ascii_table = bytes.maketrans(''.join(char for char, _ in translated).encode('ascii'),
+                                      ''.join(repl for _, repl in translated).encode('ascii'))
+        ascii_delete = ''.join(char for char, _, replacement in ascii_mappings
+                               if not replacement).encode('ascii')
+    
+    return _CompiledMappings(mappings, tuple(ascii_mappings), ascii_closed, pattern,
+                             char_pattern, has_sequences, tuple(lead_bytes), replace_all,
+                             ascii_table, ascii_delete)
+
+
+def _apply_mappings(text_content: str, compiled: _CompiledMappings,
+                    count: bool = True) -> Tuple[str, Dict[str, int]]:
+    """
+    Count and replace mapped characters in text.
+    
+    Args:
+        text_content (str): Text to clean
+        compiled (_CompiledMappings): Compiled character mappings
+        count (bool): Whether to count occurrences; if False, char_counts is empty
+        
+    Returns:
+        tuple: (cleaned_content, char_counts)
+    """
+    if not count and compiled.replace_all is not None:
+        return compiled.replace_all(text_content), {}
+    
+    if compiled.ascii_closed and text_content.isascii():
+        # Nothing outside the ASCII range can occur, so skip those mappings
+        candidates = compiled.ascii_mappings
+    elif compiled.pattern is None or not compiled.pattern.search(text_content):
+        # One scan proves the text is clean instead of one scan per mapping
+        return text_content, {}
+    else:
+        candidates = compiled.mappings
+    
+    cleaned_content = text_content
+    char_counts: Dict[str, int] = {}
+    
+    if not count:
+        # A membership test is far cheaper than replace() on a miss, and most
+        # mapped characters are absent from any given text
+        for char, _, replacement in candidates:
+            if char in cleaned_content:
+                cleaned_content = cleaned_content.replace(char, replacement)
+        return cleaned_content, char_counts
+    
+    for char, name, replacement in candidates:
+        char_count = cleaned_content.count(char)
+        if char_count > 0:
+            char_counts[name] = char_count
+            cleaned_content = cleaned_content.replace(char, replacement)
+    
+    return cleaned_content, char_counts
+
+
+def _apply_ascii_mappings(binary_content: bytes, compiled: _CompiledMappings,
+                          count: bool = True) -> Tuple[bytes, Dict[str, int]]:
+    """
+    Clean pure ASCII content as bytes, without decoding or re-encoding it.
+    
+    Args:
+        binary_content (bytes): ASCII content to clean
+        compiled (_CompiledMappings): Compiled mappings with an ASCII table
+        count (bool): Whether to count occurrences; if False, char_counts is empty
+        
+    Returns:
+        tuple: (cleaned_bytes, char_counts)
+    """
+    char_counts: Dict[str, int] = {}
+    if count:
+        for char, name, _ in compiled.ascii_mappings:
+            char_count = binary_content.count(char.encode('ascii'))
+            if char_count > 0:
+                char_counts[name] = char_count
+    
+    return binary_content.translate(compiled.ascii_table, compiled.ascii_delete), char_counts
+
+
+def _detect_bom(content: bytes) -> Optional[str]:
+    """
+    Identify the byte order mark at the start of content, if any.
+    
+    Args:
+        content (bytes): Raw content
+        
+    Returns:
+        str or None: BOM description, or None if there is no BOM
+    """
+    head = content[:4]
+    for prefix, label in _BOMS:
+        if head.startswith(prefix):
+            return label
+    return None
+
+
+def _is_unchanged_utf8(binary_content: bytes, compiled: _CompiledMappings) -> bool:
+    """
+    Check whether raw content would come out of cleaning byte-for-byte unchanged.
+    
+    Each lead byte is a single-byte search, so content that contains none of
+    them is ruled out without decoding and pattern-matching the whole text.
+    
+    Args:
+        binary_content (bytes): Raw file content
+        compiled (_CompiledMappings): Compiled character mappings
+        
+    Returns:
+        bool: True if no mapped character can be present and the content is valid UTF-8
+    """
+    for lead in compiled.lead_bytes:
+        if lead in binary_content:
+            return False
+    
+    if binary_content.isascii():
+        return True
+    
+    # Invalid sequences would be turned into replacement characters
+    try:
+        binary_content.decode('utf-8')
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def _decode_content(content: Union[bytes, str]) -> str:
+    """
+    Decode content to text, keeping any BOM so it can be handled by the mappings.
+    
+    Args:
+        content (bytes or str): Content to decode
+        
+    Returns:
+        str: Decoded text
+    """
+    if not isinstance(content, bytes):
+        return content
+    
+    # Try to decode to text without removing BOM first
+    try:
+        return content.decode('utf-8')
+    except UnicodeDecodeError:
+        # Try with error handling
+        try:
+            return content.decode('utf-8', errors='replace')
+        except:
+            # Last resort
+            return content.decode('latin-1')